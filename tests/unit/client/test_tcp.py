@@ -1,6 +1,17 @@
 import struct
+import pytest
+from itertools import count
+from threading import Thread, local
 
-from umodbus.client.tcp import _create_request_adu, _create_mbap_header
+from umodbus import conf
+from umodbus.client import tcp
+from umodbus.client.tcp import (_create_request_adu, _create_mbap_header,
+                                read_coils, read_discrete_inputs,
+                                read_holding_registers, read_input_registers,
+                                write_single_coil, write_single_register,
+                                write_multiple_coils, write_multiple_registers)
+from umodbus.exceptions import IllegalDataValueError
+from umodbus.functions import WriteMultipleCoils, WriteMultipleRegisters
 
 
 def test_create_request_adu():
@@ -24,15 +35,234 @@ def test_create_mbap_header():
     validate_mbap_fields(mbap, slave_id, pdu)
 
 
+@pytest.fixture
+def sequential_transaction_ids(monkeypatch):
+    """ Number requests sequentially, starting with a fresh counter. """
+    monkeypatch.setattr(conf, 'SEQUENTIAL_TRANSACTION_IDS', True)
+    monkeypatch.setattr(tcp, '_transaction_id_counters', local())
+
+
+def get_transaction_id(adu):
+    return int.from_bytes(adu[:2], 'big')
+
+
+def test_sequential_transaction_ids(sequential_transaction_ids):
+    """ Requests created in the same thread are numbered 1, 2, 3... """
+    assert [get_transaction_id(read_coils(1, 0, 1)),
+            get_transaction_id(write_single_coil(1, 0, 1)),
+            get_transaction_id(write_multiple_registers(1, 0, [1])),
+            get_transaction_id(_create_mbap_header(1, b'\x01'))] == \
+        [1, 2, 3, 4]
+
+
+def test_sequential_transaction_ids_wrap_around(sequential_transaction_ids):
+    """ Transaction id continues at 0 after 65535. """
+    tcp._transaction_id_counters.counter = count(65535)
+
+    assert get_transaction_id(read_coils(1, 0, 1)) == 65535
+    assert get_transaction_id(read_coils(1, 0, 1)) == 0
+
+
+def test_sequential_transaction_ids_per_thread(sequential_transaction_ids):
+    """ Every thread has its own counter. """
+    read_coils(1, 0, 1)
+    adus = []
+
+    thread = Thread(target=lambda: adus.append(read_coils(1, 0, 1)))
+    thread.start()
+    thread.join()
+
+    assert get_transaction_id(adus[0]) == 1
+    assert get_transaction_id(read_coils(1, 0, 1)) == 2
+
+
+@pytest.mark.parametrize('function, quantity, pdu', [
+    (read_coils, 3, b'\x01\x00d\x00\x03'),
+    (read_discrete_inputs, 3, b'\x02\x00d\x00\x03'),
+    (read_holding_registers, 3, b'\x03\x00d\x00\x03'),
+    (read_input_registers, 3, b'\x04\x00d\x00\x03'),
+])
+def test_read_request_pdu(function, quantity, pdu):
+    """ Validate ADU of read requests starting at address 100. """
+    adu = function(1, 100, quantity)
+
+    assert adu[7:] == pdu
+    validate_mbap_fields(adu[:7], 1, pdu)
+
+
+@pytest.mark.parametrize('function, quantity', [
+    (read_coils, 0),
+    (read_coils, 2001),
+    (read_discrete_inputs, 2001),
+    (read_holding_registers, 0x7E),
+    (read_input_registers, 0x7E),
+])
+def test_read_request_with_invalid_quantity(function, quantity):
+    """ Quantity out of range must raise IllegalDataValueError. """
+    with pytest.raises(IllegalDataValueError):
+        function(1, 100, quantity)
+
+
+@pytest.mark.parametrize('value, pdu', [
+    (0, b'\x05\x00d\x00\x00'),
+    (1, b'\x05\x00d\xff\x00'),
+    (0xFF00, b'\x05\x00d\xff\x00'),
+])
+def test_write_single_coil(value, pdu):
+    """ Validate ADU of Write Single Coil request. """
+    adu = write_single_coil(1, 100, value)
+
+    assert adu[7:] == pdu
+    validate_mbap_fields(adu[:7], 1, pdu)
+
+
+def test_write_single_coil_with_invalid_value():
+    """ Only 0, 1 and 0xFF00 are valid values for a coil. """
+    with pytest.raises(IllegalDataValueError):
+        write_single_coil(1, 100, 2)
+
+
+@pytest.mark.parametrize('signed, value, pdu', [
+    (False, 0xFFFF, b'\x06\x00d\xff\xff'),
+    (True, -1, b'\x06\x00d\xff\xff'),
+])
+def test_write_single_register(monkeypatch, signed, value, pdu):
+    """ Validate ADU of Write Single Register request. """
+    monkeypatch.setattr(conf, 'SIGNED_VALUES', signed)
+    adu = write_single_register(1, 100, value)
+
+    assert adu[7:] == pdu
+    validate_mbap_fields(adu[:7], 1, pdu)
+
+
+@pytest.mark.parametrize('signed, value', [
+    (False, -1),
+    (False, 0x10000),
+    (True, 0x8000),
+])
+def test_write_single_register_with_invalid_value(monkeypatch, signed, value):
+    """ Values that don't fit in a register must raise IllegalDataValueError.
+    """
+    monkeypatch.setattr(conf, 'SIGNED_VALUES', signed)
+
+    with pytest.raises(IllegalDataValueError):
+        write_single_register(1, 100, value)
+
+
+@pytest.mark.parametrize('function', [
+    read_coils,
+    write_single_coil,
+    write_single_register,
+])
+@pytest.mark.parametrize('slave_id, address', [
+    (256, 100),
+    (1, 0x10000),
+])
+def test_single_request_with_invalid_slave_id_or_address(function, slave_id,
+                                                         address):
+    """ Slave id or address out of range is not an invalid data value. """
+    with pytest.raises(struct.error):
+        function(slave_id, address, 1)
+
+
+@pytest.mark.parametrize('values', [
+    [1],
+    [0, 1, 1],
+    [1, 0, 0, 0, 0, 0, 0, 1],
+    [1, 1, 0, 0, 1, 0, 1, 0, 1],
+    [0] * 0x7B0,
+    [1] * 0x7B0,
+])
+def test_write_multiple_coils(values):
+    """ Validate ADU of Write Multiple Coils request against PDU created by
+    :class:`WriteMultipleCoils`.
+    """
+    function = WriteMultipleCoils()
+    function.starting_address = 100
+    function.values = values
+
+    adu = write_multiple_coils(1, 100, values)
+
+    assert adu[7:] == function.request_pdu
+    validate_mbap_fields(adu[:7], 1, function.request_pdu)
+
+
+@pytest.mark.parametrize('values', [
+    [],
+    [0] * (0x7B0 + 1),
+    [0, 2],
+    [-1],
+    [1.0],
+    [[1]],
+])
+def test_write_multiple_coils_with_invalid_values(values):
+    """ Invalid values must raise IllegalDataValueError. """
+    with pytest.raises(IllegalDataValueError):
+        write_multiple_coils(1, 100, values)
+
+
+@pytest.mark.parametrize('signed, values', [
+    (False, [1337]),
+    (False, [0, 1, 0xFFFF]),
+    (False, [1] * 0x7B),
+    (True, [-1, 0, 0x7FFF, -0x8000]),
+])
+def test_write_multiple_registers(monkeypatch, signed, values):
+    """ Validate ADU of Write Multiple Registers request against PDU created by
+    :class:`WriteMultipleRegisters`.
+    """
+    monkeypatch.setattr(conf, 'SIGNED_VALUES', signed)
+
+    function = WriteMultipleRegisters()
+    function.starting_address = 100
+    function.values = values
+
+    adu = write_multiple_registers(1, 100, values)
+
+    assert adu[7:] == function.request_pdu
+    validate_mbap_fields(adu[:7], 1, function.request_pdu)
+
+
+@pytest.mark.parametrize('signed, values', [
+    (False, []),
+    (False, [0] * (0x7B + 1)),
+    (False, [-1]),
+    (False, [0x10000]),
+    (True, [0x8000]),
+])
+def test_write_multiple_registers_with_invalid_values(monkeypatch, signed,
+                                                      values):
+    """ Invalid values must raise IllegalDataValueError. """
+    monkeypatch.setattr(conf, 'SIGNED_VALUES', signed)
+
+    with pytest.raises(IllegalDataValueError):
+        write_multiple_registers(1, 100, values)
+
+
+@pytest.mark.parametrize('function', [
+    write_multiple_coils,
+    write_multiple_registers,
+])
+@pytest.mark.parametrize('slave_id, starting_address', [
+    (256, 100),
+    (1, 0x10000),
+])
+def test_multiple_request_with_invalid_slave_id_or_address(function, slave_id,
+                                                           starting_address):
+    """ Slave id or address out of range is not an invalid data value. """
+    with pytest.raises(struct.error):
+        function(slave_id, starting_address, [1])
+
+
 def validate_mbap_fields(mbap, slave_id, pdu):
     """ Check if fields in MBAP header contain expected values. """
-    transaction_id = struct.unpack('>H', mbap[:2])[0]
-    protocol_id = struct.unpack('>H', mbap[2:4])[0]
-    length = struct.unpack('>H', mbap[4:6])[0]
-    unit_id = struct.unpack('>B', mbap[6:])[0]
+    transaction_id = int.from_bytes(mbap[:2], 'big')
+    protocol_id = int.from_bytes(mbap[2:4], 'big')
+    length = int.from_bytes(mbap[4:6], 'big')
+    unit_id = mbap[6]
 
     assert len(mbap) == 7
-    assert 0 <= transaction_id <= 65536
+    assert 0 <= transaction_id <= 65535
     assert protocol_id == 0
     assert length == len(pdu) + 1
     assert unit_id == slave_id
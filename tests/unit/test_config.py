@@ -1,9 +1,13 @@
+from umodbus.config import Config
+
+
 class TestConfig:
     def test_defaults(self, config):
         """ Test whether defaults configuration values are correct. """
         assert config.SINGLE_BIT_VALUE_FORMAT_CHARACTER == 'B'
         assert config.MULTI_BIT_VALUE_FORMAT_CHARACTER == 'H'
         assert not config.SIGNED_VALUES
+        assert not config.SEQUENTIAL_TRANSACTION_IDS
 
     def test_multi_bit_value_signed(self, config):
         """  Test if MULTI_BIT_VALUE_FORMAT_CHARACTER changes when setting
@@ -12,3 +16,10 @@ class TestConfig:
         assert config.MULTI_BIT_VALUE_FORMAT_CHARACTER == 'H'
         config.SIGNED_VALUES = True
         assert config.MULTI_BIT_VALUE_FORMAT_CHARACTER == 'h'
+
+    def test_sequential_transaction_ids_from_environment(self, monkeypatch):
+        """ Test if SEQUENTIAL_TRANSACTION_IDS can be set using environment
+        variable.
+        """
+        monkeypatch.setenv('UMODBUS_SEQUENTIAL_TRANSACTION_IDS', '1')
+        assert Config().SEQUENTIAL_TRANSACTION_IDS
@@ -215,6 +215,17 @@ def test_read_holding_registers_response_pdu(read_holding_registers):
     assert instance.data == [1337, 17, 21, 18]
 
 
+def test_read_holding_registers_response_pdu_with_too_many_values(
+        read_holding_registers):
+    """ Response with more values than requested must be rejected. """
+    response_pdu =\
+        read_holding_registers.create_response_pdu([1337, 17, 21, 18, 5])
+
+    with pytest.raises(struct.error):
+        ReadHoldingRegisters.create_from_response_pdu(
+            response_pdu, read_holding_registers.request_pdu)
+
+
 def test_read_input_registers_class_attributes():
     assert ReadInputRegisters.function_code == 4
     assert ReadInputRegisters.max_quantity == 125
@@ -239,6 +250,16 @@ def test_read_input_registers_response_pdu(read_input_registers):
     assert instance.data == [994, 1100]
 
 
+def test_read_input_registers_response_pdu_with_too_many_values(
+        read_input_registers):
+    """ Response with more values than requested must be rejected. """
+    response_pdu = read_input_registers.create_response_pdu([994, 1100, 5])
+
+    with pytest.raises(struct.error):
+        ReadInputRegisters.create_from_response_pdu(
+            response_pdu, read_input_registers.request_pdu)
+
+
 def test_write_single_coil_class_attributes():
     assert WriteSingleCoil.function_code == 5
 
@@ -1,17 +1,15 @@
-import struct
-
 from umodbus.client.tcp import _create_request_adu, _create_mbap_header
 
 
 def validate_mbap_fields(mbap, slave_id, pdu):
     """ Check if fields in MBAP header contain expected values. """
-    transaction_id = struct.unpack('>H', mbap[:2])[0]
-    protocol_id = struct.unpack('>H', mbap[2:4])[0]
-    length = struct.unpack('>H', mbap[4:6])[0]
-    unit_id = struct.unpack('>B', mbap[6:])[0]
+    transaction_id = int.from_bytes(mbap[:2], 'big')
+    protocol_id = int.from_bytes(mbap[2:4], 'big')
+    length = int.from_bytes(mbap[4:6], 'big')
+    unit_id = mbap[6]
 
     assert len(mbap) == 7
-    assert 0 <= transaction_id <= 65536
+    assert 0 <= transaction_id <= 65535
     assert protocol_id == 0
     assert length == len(pdu) + 1
     assert unit_id == slave_id
@@ -83,8 +83,11 @@ byte) + PDU (5 bytes).
 
 """
 import struct
-from random import randint
+import threading
+from itertools import count
+from random import getrandbits
 
+from umodbus import conf
 from umodbus.functions import (create_function_from_response_pdu,
                                expected_response_pdu_size_from_request_pdu,
                                pdu_to_function_code_or_raise_error, ReadCoils,
@@ -92,7 +95,50 @@ from umodbus.functions import (create_function_from_response_pdu,
                                ReadInputRegisters, WriteSingleCoil,
                                WriteSingleRegister, WriteMultipleCoils,
                                WriteMultipleRegisters)
-from umodbus.utils import recv_exactly
+from umodbus.utils import pack_mbap, recv_exactly
+
+# Precompiled structs for complete request ADUs of function codes 01 up to and
+# including 06. These consist of a MBAP header followed by a PDU with Function
+# code, (Starting) address and Quantity or Value. The value of a Write Single
+# Register request is signed or unsigned, depending on `conf.SIGNED_VALUES`.
+_REQUEST_ADU_STRUCT = struct.Struct('>HHHBBHH')
+_SIGNED_REQUEST_ADU_STRUCT = struct.Struct('>HHHBBHh')
+
+# Value of Length field in MBAP header of these ADUs: Unit identifier (1 byte)
+# + PDU (5 bytes).
+_REQUEST_ADU_LENGTH = 6
+
+# Precompiled struct for the fixed part of request PDUs of function code 15:
+# Function code, Starting address, Quantity and Byte count.
+_WRITE_MULTIPLE_COILS_PDU_STRUCT = struct.Struct('>BHHB')
+
+# Translation table which maps coil values 0 and 1 to the digits '0' and '1'.
+_COIL_VALUES_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+# Holds a counter per thread, used when `conf.SEQUENTIAL_TRANSACTION_IDS` is
+# set.
+_transaction_id_counters = threading.local()
+
+
+def _create_transaction_id():
+    """ Return Transaction identifier for a new request.
+
+    This is a random number, unless `conf.SEQUENTIAL_TRANSACTION_IDS` is set.
+    In that case requests created by the same thread are numbered
+    sequentially, starting at 1.
+
+    :return: Number between 0 and 65535.
+    """
+    if not conf.SEQUENTIAL_TRANSACTION_IDS:
+        return getrandbits(16)
+
+    try:
+        counter = _transaction_id_counters.counter
+    except AttributeError:
+        counter = _transaction_id_counters.counter = count(1)
+
+    # Transaction identifier is 2 bytes, so wrap around after 65535.
+    return next(counter) & 0xFFFF
 
 
 def _create_request_adu(slave_id, pdu):
@@ -112,11 +158,34 @@ def _create_mbap_header(slave_id, pdu):
     :param pdu: Byte array with PDU.
     :return: Byte array of 7 bytes with MBAP header.
     """
-    # 65535 = (2**16)-1 aka maximum number that fits in 2 bytes.
-    transaction_id = randint(0, 65535)
+    transaction_id = _create_transaction_id()
     length = len(pdu) + 1
 
-    return struct.pack('>HHHB', transaction_id, 0, length, slave_id)
+    return pack_mbap(transaction_id, 0, length, slave_id)
+
+
+def _create_read_request_adu(slave_id, function, starting_address, quantity):
+    """ Return ADU for a request of one of the read function codes 01 up to
+    and including 04.
+
+    The ADU is packed at once, instead of building the PDU through an
+    instance of `function`. The quantity is validated the same way.
+
+    :param slave_id: Number of slave.
+    :param function: One of the read function classes, like
+        :class:`umodbus.functions.ReadCoils`.
+    :param starting_address: Starting address.
+    :param quantity: Number of coils, inputs or registers to read.
+    :return: Byte array with ADU.
+    :raises IllegalDataValueError: When quantity is out of range.
+    """
+    function.validate_quantity(quantity)
+
+    transaction_id = _create_transaction_id()
+
+    return _REQUEST_ADU_STRUCT.pack(transaction_id, 0, _REQUEST_ADU_LENGTH,
+                                    slave_id, function.function_code,
+                                    starting_address, quantity)
 
 
 def read_coils(slave_id, starting_address, quantity):
@@ -125,11 +194,8 @@ def read_coils(slave_id, starting_address, quantity):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = ReadCoils()
-    function.starting_address = starting_address
-    function.quantity = quantity
-
-    return _create_request_adu(slave_id, function.request_pdu)
+    return _create_read_request_adu(slave_id, ReadCoils,
+                                    starting_address, quantity)
 
 
 def read_discrete_inputs(slave_id, starting_address, quantity):
@@ -138,11 +204,8 @@ def read_discrete_inputs(slave_id, starting_address, quantity):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = ReadDiscreteInputs()
-    function.starting_address = starting_address
-    function.quantity = quantity
-
-    return _create_request_adu(slave_id, function.request_pdu)
+    return _create_read_request_adu(slave_id, ReadDiscreteInputs,
+                                    starting_address, quantity)
 
 
 def read_holding_registers(slave_id, starting_address, quantity):
@@ -151,11 +214,8 @@ def read_holding_registers(slave_id, starting_address, quantity):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = ReadHoldingRegisters()
-    function.starting_address = starting_address
-    function.quantity = quantity
-
-    return _create_request_adu(slave_id, function.request_pdu)
+    return _create_read_request_adu(slave_id, ReadHoldingRegisters,
+                                    starting_address, quantity)
 
 
 def read_input_registers(slave_id, starting_address, quantity):
@@ -164,11 +224,8 @@ def read_input_registers(slave_id, starting_address, quantity):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = ReadInputRegisters()
-    function.starting_address = starting_address
-    function.quantity = quantity
-
-    return _create_request_adu(slave_id, function.request_pdu)
+    return _create_read_request_adu(slave_id, ReadInputRegisters,
+                                    starting_address, quantity)
 
 
 def write_single_coil(slave_id, address, value):
@@ -177,11 +234,14 @@ def write_single_coil(slave_id, address, value):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = WriteSingleCoil()
-    function.address = address
-    function.value = value
+    WriteSingleCoil.validate_value(value)
 
-    return _create_request_adu(slave_id, function.request_pdu)
+    value = 0xFF00 if value == 1 else value
+    transaction_id = _create_transaction_id()
+
+    return _REQUEST_ADU_STRUCT.pack(transaction_id, 0, _REQUEST_ADU_LENGTH,
+                                    slave_id, WriteSingleCoil.function_code,
+                                    address, value)
 
 
 def write_single_register(slave_id, address, value):
@@ -190,11 +250,17 @@ def write_single_register(slave_id, address, value):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = WriteSingleRegister()
-    function.address = address
-    function.value = value
+    WriteSingleRegister.validate_value(value)
+
+    adu_struct = _REQUEST_ADU_STRUCT
+
+    if conf.SIGNED_VALUES:
+        adu_struct = _SIGNED_REQUEST_ADU_STRUCT
+
+    transaction_id = _create_transaction_id()
 
-    return _create_request_adu(slave_id, function.request_pdu)
+    return adu_struct.pack(transaction_id, 0, _REQUEST_ADU_LENGTH, slave_id,
+                           WriteSingleRegister.function_code, address, value)
 
 
 def write_multiple_coils(slave_id, starting_address, values):
@@ -203,11 +269,22 @@ def write_multiple_coils(slave_id, starting_address, values):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = WriteMultipleCoils()
-    function.starting_address = starting_address
-    function.values = values
+    WriteMultipleCoils.validate_values(values)
 
-    return _create_request_adu(slave_id, function.request_pdu)
+    quantity = len(values)
+    byte_count = (quantity + 7) // 8
+
+    # Status of the first coil is the Least Significant Bit (LSB) of the first
+    # byte. Reading the values in reverse order as a binary number and
+    # converting that number to little endian bytes gives that order.
+    digits = bytes(values).translate(_COIL_VALUES_TO_DIGITS)[::-1]
+    coils_status = int(digits, 2).to_bytes(byte_count, 'little')
+
+    pdu = _WRITE_MULTIPLE_COILS_PDU_STRUCT.pack(
+        WriteMultipleCoils.function_code, starting_address, quantity,
+        byte_count) + coils_status
+
+    return _create_request_adu(slave_id, pdu)
 
 
 def write_multiple_registers(slave_id, starting_address, values):
@@ -216,11 +293,14 @@ def write_multiple_registers(slave_id, starting_address, values):
     :param slave_id: Number of slave.
     :return: Byte array with ADU.
     """
-    function = WriteMultipleRegisters()
-    function.starting_address = starting_address
-    function.values = values
+    WriteMultipleRegisters.validate_values(values)
+
+    quantity = len(values)
+    fmt = '>BHHB' + conf.TYPE_CHAR * quantity
+    pdu = struct.pack(fmt, WriteMultipleRegisters.function_code,
+                      starting_address, quantity, quantity * 2, *values)
 
-    return _create_request_adu(slave_id, function.request_pdu)
+    return _create_request_adu(slave_id, pdu)
 
 
 def parse_response_adu(resp_adu, req_adu=None):
@@ -27,9 +27,12 @@ class Config(object):
         modify this value.
 
     """
+
     def __init__(self):
         self.SIGNED_VALUES = os.environ.get('UMODBUS_SIGNED_VALUES', False)
         self.BIT_SIZE = os.environ.get('UMODBUS_BIT_SIZE', 16)
+        self.SEQUENTIAL_TRANSACTION_IDS = \
+            os.environ.get('UMODBUS_SEQUENTIAL_TRANSACTION_IDS', False)
 
     @property
     def TYPE_CHAR(self):
@@ -89,3 +92,26 @@ class Config(object):
         """
         self._BIT_SIZE = value
         self._set_multi_bit_value_format_character()
+
+    @property
+    def SEQUENTIAL_TRANSACTION_IDS(self):
+        """ Whether the TCP client numbers its requests sequentially. Default
+        is False.
+
+        By default the Transaction identifier of a request is a random number.
+        When set to True, each thread numbers its requests 1, 2, 3 and so on.
+        After 65535 it continues at 0.
+
+        This value can also be set using the environment variable
+        `UMODBUS_SEQUENTIAL_TRANSACTION_IDS`.
+        """
+        return self._SEQUENTIAL_TRANSACTION_IDS
+
+    @SEQUENTIAL_TRANSACTION_IDS.setter
+    def SEQUENTIAL_TRANSACTION_IDS(self, value):
+        """ Set whether Transaction identifiers are sequential.
+
+        :param value: Boolean indicating if Transaction identifiers are
+            sequential or random.
+        """
+        self._SEQUENTIAL_TRANSACTION_IDS = value
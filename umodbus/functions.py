@@ -257,13 +257,21 @@ class ReadCoils(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 2000):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(2000))
-
+        self.validate_quantity(value)
         self._quantity = value
 
+    @classmethod
+    def validate_quantity(cls, value):
+        """ Check if quantity is between 1 and :attr:`max_quantity`.
+
+        :param value: Quantity.
+        :raises: IllegalDataValueError.
+        """
+        if not (1 <= value <= cls.max_quantity):
+            raise IllegalDataValueError('Quantity field of request must be a '
+                                        'value between 1 and '
+                                        '{0}.'.format(cls.max_quantity))
+
     @property
     def request_pdu(self):
         """ Build request PDU to read coils.
@@ -458,13 +466,21 @@ class ReadDiscreteInputs(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 2000):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(2000))
-
+        self.validate_quantity(value)
         self._quantity = value
 
+    @classmethod
+    def validate_quantity(cls, value):
+        """ Check if quantity is between 1 and :attr:`max_quantity`.
+
+        :param value: Quantity.
+        :raises: IllegalDataValueError.
+        """
+        if not (1 <= value <= cls.max_quantity):
+            raise IllegalDataValueError('Quantity field of request must be a '
+                                        'value between 1 and '
+                                        '{0}.'.format(cls.max_quantity))
+
     @property
     def request_pdu(self):
         """ Build request PDU to read discrete inputs.
@@ -650,13 +666,21 @@ class ReadHoldingRegisters(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 0x007D):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(0x007D))
-
+        self.validate_quantity(value)
         self._quantity = value
 
+    @classmethod
+    def validate_quantity(cls, value):
+        """ Check if quantity is between 1 and :attr:`max_quantity`.
+
+        :param value: Quantity.
+        :raises: IllegalDataValueError.
+        """
+        if not (1 <= value <= cls.max_quantity):
+            raise IllegalDataValueError('Quantity field of request must be a '
+                                        'value between 1 and '
+                                        '{0}.'.format(cls.max_quantity))
+
     @property
     def request_pdu(self):
         """ Build request PDU to read coils.
@@ -716,8 +740,7 @@ class ReadHoldingRegisters(ModbusFunction):
         """
         read_holding_registers = cls()
         read_holding_registers.quantity = struct.unpack('>H', req_pdu[-2:])[0]
-        read_holding_registers.byte_count = \
-            struct.unpack('>B', resp_pdu[1:2])[0]
+        read_holding_registers.byte_count = resp_pdu[1]
 
         fmt = '>' + (conf.TYPE_CHAR * read_holding_registers.quantity)
         read_holding_registers.data = list(struct.unpack(fmt, resp_pdu[2:]))
@@ -825,13 +848,21 @@ class ReadInputRegisters(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 0x007D):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(0x007D))
-
+        self.validate_quantity(value)
         self._quantity = value
 
+    @classmethod
+    def validate_quantity(cls, value):
+        """ Check if quantity is between 1 and :attr:`max_quantity`.
+
+        :param value: Quantity.
+        :raises: IllegalDataValueError.
+        """
+        if not (1 <= value <= cls.max_quantity):
+            raise IllegalDataValueError('Quantity field of request must be a '
+                                        'value between 1 and '
+                                        '{0}.'.format(cls.max_quantity))
+
     @property
     def request_pdu(self):
         """ Build request PDU to read coils.
@@ -990,12 +1021,21 @@ class WriteSingleCoil(ModbusFunction):
 
     @value.setter
     def value(self, value):
-        if value not in [0, 1, 0xFF00]:
-            raise IllegalDataValueError
+        self.validate_value(value)
 
         value = 0xFF00 if value == 1 else value
         self._value = value
 
+    @classmethod
+    def validate_value(cls, value):
+        """ Check if value is a valid coil value: 0, 1 or 0xFF00.
+
+        :param value: An integer.
+        :raises: IllegalDataValueError when value isn't valid.
+        """
+        if value not in [0, 1, 0xFF00]:
+            raise IllegalDataValueError
+
     @property
     def request_pdu(self):
         """ Build request PDU to write single coil.
@@ -1052,7 +1092,7 @@ class WriteSingleCoil(ModbusFunction):
         """
         write_single_coil = cls()
 
-        address, value = struct.unpack('>HH', resp_pdu[1:5])
+        address, value = struct.unpack_from('>HH', resp_pdu, 1)
         value = 1 if value == 0xFF00 else value
 
         write_single_coil.address = address
@@ -1135,6 +1175,16 @@ class WriteSingleRegister(ModbusFunction):
     def value(self, value):
         """ Value to be written on register.
 
+        :param value: An integer.
+        :raises: IllegalDataValueError when value isn't in range.
+        """
+        self.validate_value(value)
+        self._value = value
+
+    @classmethod
+    def validate_value(cls, value):
+        """ Check if value fits in a register.
+
         :param value: An integer.
         :raises: IllegalDataValueError when value isn't in range.
         """
@@ -1143,8 +1193,6 @@ class WriteSingleRegister(ModbusFunction):
         except struct.error:
             raise IllegalDataValueError
 
-        self._value = value
-
     @property
     def request_pdu(self):
         """ Build request PDU to write single register.
@@ -1195,7 +1243,8 @@ class WriteSingleRegister(ModbusFunction):
         """
         write_single_register = cls()
 
-        address, value = struct.unpack('>H' + conf.TYPE_CHAR, resp_pdu[1:5])
+        address, value = \
+            struct.unpack_from('>H' + conf.TYPE_CHAR, resp_pdu, 1)
 
         write_single_register.address = address
         write_single_register.data = value
@@ -1271,6 +1320,7 @@ class WriteMultipleCoils(ModbusFunction):
 
     """
     function_code = WRITE_MULTIPLE_COILS
+    max_quantity = 0x7B0
 
     starting_address = None
     _values = None
@@ -1282,15 +1332,24 @@ class WriteMultipleCoils(ModbusFunction):
 
     @values.setter
     def values(self, values):
-        if not (1 <= len(values) <= 0x7B0):
+        self.validate_values(values)
+        self._values = values
+
+    @classmethod
+    def validate_values(cls, values):
+        """ Check if number of values is in range and if all values are 0 or
+        1.
+
+        :param values: A list with 0's and/or 1's.
+        :raises: IllegalDataValueError when values aren't valid.
+        """
+        if not (1 <= len(values) <= cls.max_quantity):
             raise IllegalDataValueError
 
         for value in values:
-            if value not in [0, 1]:
+            if not (isinstance(value, int) and value in (0, 1)):
                 raise IllegalDataValueError
 
-        self._values = values
-
     @property
     def request_pdu(self):
         if None in [self.starting_address, self._values]:
@@ -1362,7 +1421,7 @@ class WriteMultipleCoils(ModbusFunction):
         :param pdu: A request PDU.
         """
         _, starting_address, quantity, byte_count = \
-            struct.unpack('>BHHB', pdu[:6])
+            struct.unpack_from('>BHHB', pdu)
 
         fmt = '>' + (conf.SINGLE_BIT_VALUE_FORMAT_CHARACTER * byte_count)
         values = struct.unpack(fmt, pdu[6:])
@@ -1406,7 +1465,7 @@ class WriteMultipleCoils(ModbusFunction):
     def create_from_response_pdu(cls, resp_pdu):
         write_multiple_coils = cls()
 
-        starting_address, data = struct.unpack('>HH', resp_pdu[1:5])
+        starting_address, data = struct.unpack_from('>HH', resp_pdu, 1)
 
         write_multiple_coils.starting_address = starting_address
         write_multiple_coils.data = data
@@ -1481,6 +1540,7 @@ class WriteMultipleRegisters(ModbusFunction):
 
     """
     function_code = WRITE_MULTIPLE_REGISTERS
+    max_quantity = 0x7B
 
     starting_address = None
     _values = None
@@ -1492,17 +1552,28 @@ class WriteMultipleRegisters(ModbusFunction):
 
     @values.setter
     def values(self, values):
-        if not (1 <= len(values) <= 0x7B0):
+        self.validate_values(values)
+        self._values = values
+
+    @classmethod
+    def validate_values(cls, values):
+        """ Check if number of values is in range and if all values fit in a
+        register.
+
+        :param values: A list with integers.
+        :raises: IllegalDataValueError when values aren't valid.
+        """
+        if not (1 <= len(values) <= cls.max_quantity):
             raise IllegalDataValueError
 
-        for value in values:
-            try:
-                struct.pack(">" + conf.MULTI_BIT_VALUE_FORMAT_CHARACTER, value)
-            except struct.error:
-                raise IllegalDataValueError
+        # Pack all values with a single call. It fails when a value doesn't fit
+        # in a register.
+        fmt = '>' + conf.MULTI_BIT_VALUE_FORMAT_CHARACTER * len(values)
 
-        self._values = values
-        self._values = values
+        try:
+            struct.pack(fmt, *values)
+        except struct.error:
+            raise IllegalDataValueError
 
     @property
     def request_pdu(self):
@@ -1519,7 +1590,7 @@ class WriteMultipleRegisters(ModbusFunction):
         :return: Instance of this class.
         """
         _, starting_address, quantity, byte_count = \
-            struct.unpack('>BHHB', pdu[:6])
+            struct.unpack_from('>BHHB', pdu)
 
         # Values are 16 bit, so each value takes up 2 bytes.
         fmt = '>' + (conf.MULTI_BIT_VALUE_FORMAT_CHARACTER *
@@ -1554,7 +1625,7 @@ class WriteMultipleRegisters(ModbusFunction):
     def create_from_response_pdu(cls, resp_pdu):
         write_multiple_registers = cls()
 
-        starting_address, data = struct.unpack('>HH', resp_pdu[1:5])
+        starting_address, data = struct.unpack_from('>HH', resp_pdu, 1)
 
         write_multiple_registers.starting_address = starting_address
         write_multiple_registers.data = data
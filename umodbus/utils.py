@@ -2,10 +2,12 @@ import sys
 import struct
 import logging
 from logging import StreamHandler, Formatter
-from functools import wraps
 
 from umodbus import log
 
+# Precompiled struct for the MBAP header, see :func:`unpack_mbap`.
+_MBAP_STRUCT = struct.Struct('>HHHB')
+
 
 def log_to_stream(stream=sys.stderr, level=logging.NOTSET,
                   fmt=logging.BASIC_FORMAT):
@@ -39,7 +41,7 @@ def unpack_mbap(mbap):
 
     # TODO What it right exception to raise? Error code 04, Server failure,
     # seems most appropriate.
-    return struct.unpack('>HHHB', mbap)
+    return _MBAP_STRUCT.unpack(mbap)
 
 
 def pack_mbap(transaction_id, protocol_id, length, unit_id):
@@ -51,7 +53,7 @@ def pack_mbap(transaction_id, protocol_id, length, unit_id):
     :param unit_id: Unit id.
     :return: Byte array of 7 bytes.
     """
-    return struct.pack('>HHHB', transaction_id, protocol_id, length, unit_id)
+    return _MBAP_STRUCT.pack(transaction_id, protocol_id, length, unit_id)
 
 
 def pack_exception_pdu(function_code, error_code):
@@ -100,20 +102,6 @@ def get_function_code_from_request_pdu(pdu):
     return struct.unpack('>B', pdu[:1])[0]
 
 
-def memoize(f):
-    """ Decorator which caches function's return value each it is called.
-    If called later with same arguments, the cached value is returned.
-    """
-    cache = {}
-
-    @wraps(f)
-    def inner(arg):
-        if arg not in cache:
-            cache[arg] = f(arg)
-        return cache[arg]
-    return inner
-
-
 def recv_exactly(recv_fn, size):
     """ Use the function to read and return exactly number of bytes desired.
 